@@ -0,0 +1,61 @@
+import atexit
+
+from playwright.sync_api import sync_playwright
+
+
+class BrowserPool:
+    """Process-wide owner of the Playwright instance and its browsers.
+
+    One Chromium is launched per distinct set of launch options and reused;
+    callers open cheap contexts on it instead of paying the cold start.
+    """
+    _instance = None
+
+    def __init__(self):
+        self._playwright = None
+        self._browsers = {}
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @property
+    def playwright(self):
+        if self._playwright is None:
+            self._playwright = sync_playwright().start()
+        return self._playwright
+
+    def get_browser(self, **launch_args):
+        key = repr(sorted(launch_args.items()))
+        browser = self._browsers.get(key)
+        if browser is None or not browser.is_connected():
+            browser = self.playwright.chromium.launch(**launch_args)
+            self._browsers[key] = browser
+        return browser
+
+    def close(self):
+        try:
+            for browser in self._browsers.values():
+                try:
+                    browser.close()
+                except Exception:
+                    pass
+            self._browsers.clear()
+        finally:
+            if self._playwright is not None:
+                self._playwright.stop()
+                self._playwright = None
+
+
+def get_browser(**launch_args):
+    return BrowserPool.instance().get_browser(**launch_args)
+
+
+def release():
+    if BrowserPool._instance is not None:
+        BrowserPool._instance.close()
+
+
+atexit.register(release)
@@ -1,6 +1,7 @@
-from playwright.sync_api import sync_playwright
+from .browser_pool import BrowserPool
 
-class PlaywrightDriver:
+class DriverSession:
+    """One context + page on the shared browser; cheap to create and close."""
     def __init__(
         self,
         headless=False,
@@ -9,13 +10,14 @@ class PlaywrightDriver:
         use_cdp=False,
         cdp_url=None,
     ):
-        self.playwright = sync_playwright().start()
+        pool = BrowserPool.instance()
 
         # --- CDP Mode -------------------------------------------------
         if use_cdp:
             if not cdp_url:
                 raise ValueError("CDP mode requires a cdp_url")
-            self.browser = self.playwright.chromium.connect_over_cdp(cdp_url)
+            self.browser = pool.playwright.chromium.connect_over_cdp(cdp_url)
+            self.context = None
             context = self.browser.contexts[0] if self.browser.contexts else self.browser.new_context()
             self.page = context.new_page()
             return
@@ -28,8 +30,9 @@ class PlaywrightDriver:
         if executable_path:
             launch_args["executable_path"] = executable_path
 
-        self.browser = self.playwright.chromium.launch(**launch_args)
-        self.page = self.browser.new_page()
+        self.browser = pool.get_browser(**launch_args)
+        self.context = self.browser.new_context()
+        self.page = self.context.new_page()
 
     # --- Actions -------------------------------------------------------
     def goto(self, url):
@@ -49,7 +52,12 @@ class PlaywrightDriver:
 
     # --- Cleanup -------------------------------------------------------
     def close(self):
-        try:
+        # pooled browser stays up for the next session; a CDP connection is ours to drop
+        if self.context is not None:
+            self.context.close()
+        else:
             self.browser.close()
-        finally:
-            self.playwright.stop()
+
+
+# kept for existing callers
+PlaywrightDriver = DriverSession
@@ -1,4 +1,4 @@
-from drivers.playwright_driver import PlaywrightDriver
+from drivers.playwright_driver import DriverSession
 from pipelines.handler_pipeline import HandlerPipeline
 
 actions = [
@@ -15,7 +15,7 @@ actions = [
 
 ]
 
-driver = PlaywrightDriver(headless=False)
+driver = DriverSession(headless=False)
 pipeline = HandlerPipeline()
 
 try:
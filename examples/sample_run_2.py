@@ -4,12 +4,13 @@ from urllib.parse import urljoin
 import hashlib
 import os
 import json
-import io
 import pikepdf   # <-- added
 
 FORM_URL = "https://www.uscis.gov/i-765"
 HASH_FILE = "i-765-hash.json"
 PDF_FILE = "i-765-latest.pdf"
+TMP_PDF_FILE = PDF_FILE + ".part"
+CHUNK_SIZE = 64 * 1024
 
 # --- Step 1: Fetch canonical USCIS page ---
 page = requests.get(FORM_URL)
@@ -19,22 +20,24 @@ soup = BeautifulSoup(page.text, "html.parser")
 pdf_link = soup.select_one('a[href$=".pdf"]')["href"]
 pdf_url = urljoin(FORM_URL, pdf_link)
 
-# --- Step 3: Download current PDF ---
-pdf_data = requests.get(pdf_url).content
+# --- Step 3: Download current PDF (streamed to disk, hashed chunk by chunk) ---
+hasher = hashlib.sha256()
+with requests.get(pdf_url, stream=True) as r, open(TMP_PDF_FILE, "wb") as f:
+    r.raise_for_status()
+    for chunk in r.iter_content(CHUNK_SIZE):
+        hasher.update(chunk)
+        f.write(chunk)
+new_hash = hasher.hexdigest()
 
 # --- NEW: Metadata extraction with pikepdf ---
 print("\nPDF Metadata:")
 try:
-    pdf = pikepdf.open(io.BytesIO(pdf_data))
-    metadata = pdf.docinfo
-    for key, value in metadata.items():
-        print(f"  {key}: {value}")
+    with pikepdf.open(TMP_PDF_FILE) as pdf:
+        for key, value in pdf.docinfo.items():
+            print(f"  {key}: {value}")
 except Exception as e:
     print("Could not read PDF metadata:", e)
 
-# Compute hash of current PDF
-new_hash = hashlib.sha256(pdf_data).hexdigest()
-
 # --- Step 4: Load previous hash (if exists) ---
 if os.path.exists(HASH_FILE):
     with open(HASH_FILE, "r") as f:
@@ -48,12 +51,12 @@ changed = (old_hash != new_hash)
 if changed:
     print("\n⚠️ Form I-765 has changed!")
     # Save updated PDF
-    with open(PDF_FILE, "wb") as f:
-        f.write(pdf_data)
+    os.replace(TMP_PDF_FILE, PDF_FILE)
     # Save new hash
     with open(HASH_FILE, "w") as f:
         json.dump({"hash": new_hash}, f, indent=2)
 else:
+    os.remove(TMP_PDF_FILE)
     print("\nNo change detected.")
 
 # Output useful info
@@ -16,6 +16,7 @@ FETCHING LAYER
   - PdfLocator (uses multiple strategies)
 
 EXTRACTION LAYER
+  - PdfMerkleHasher
   - PdfMetadataExtractor
   - PdfTextExtractor
   - PdfFieldExtractor
@@ -41,27 +42,54 @@ NOTIFICATION LAYER
 
 import os
 import io
+import gzip
 import json
-import time
+import re
 import difflib
 import hashlib
 import logging
 import requests
 import datetime
 from typing import Optional, Dict, Tuple
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import pikepdf
-import pdfplumber
 
 # Optional dependencies
 try:
-    from playwright.sync_api import sync_playwright
+    import playwright.sync_api  # noqa: F401
     PLAYWRIGHT_AVAILABLE = True
 except Exception:
     PLAYWRIGHT_AVAILABLE = False
 
+# selectolax is a C-backed HTML parser; BeautifulSoup is the fallback
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except Exception:
+    from bs4 import BeautifulSoup
+    SELECTOLAX_AVAILABLE = False
+
+# orjson parses/serializes state several times faster than the stdlib
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except Exception:
+    ORJSON_AVAILABLE = False
+
+# PyMuPDF is much faster for plain text; pdfplumber is the fallback
+try:
+    import fitz
+    FITZ_AVAILABLE = True
+except Exception:
+    import pdfplumber
+    FITZ_AVAILABLE = False
+
+logger = logging.getLogger("i765_monitor")
+
 # ----------------------------------------------------
 # CONFIG
 # ----------------------------------------------------
@@ -70,6 +98,7 @@ class Config:
     BASE_DIR = "./i765_monitor"
     SNAPSHOT_DIR = "snapshots"
     STATE_FILE = "state.json"
+    SNAPSHOT_COMPRESS = True
     USER_AGENT = "i765-monitor/2.0 (+https://example.com)"
     RETRIES = 3
     BACKOFF = 2
@@ -77,6 +106,25 @@ class Config:
     PLAYWRIGHT = True
     PLAYWRIGHT_TIMEOUT_MS = 45000
     WEBHOOK_URL = os.getenv("WEBHOOK_URL", "")
+    POOL_MAXSIZE = 20
+    CHUNK_SIZE = 64 * 1024
+    MERKLE_LEAF_SIZE = 256
+    MERKLE_MAX_CHANGED_LEAVES = 8
+
+    # Shared HTTP session: keeps TCP/TLS connections alive across the page
+    # fetch, the PDF download and webhook notifications.
+    SESSION = requests.Session()
+    SESSION.headers.update({"User-Agent": USER_AGENT})
+    _adapter = HTTPAdapter(
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=Retry(
+            total=RETRIES,
+            backoff_factor=BACKOFF,
+            status_forcelist=(429, 500, 502, 503, 504),
+        ),
+    )
+    SESSION.mount("https://", _adapter)
+    SESSION.mount("http://", _adapter)
 
 
 # ----------------------------------------------------
@@ -89,31 +137,33 @@ class IFetcher:
 
 class HttpFetcher(IFetcher):
     def fetch(self, url: str) -> Optional[str]:
-        headers = {"User-Agent": Config.USER_AGENT}
-        for attempt in range(1, Config.RETRIES + 1):
-            try:
-                r = requests.get(url, headers=headers, timeout=Config.TIMEOUT)
-                r.raise_for_status()
-                return r.text
-            except Exception as e:
-                if attempt == Config.RETRIES:
-                    raise
-                time.sleep(Config.BACKOFF ** attempt)
-        return None
+        # retries/backoff are handled by the session's HTTPAdapter
+        r = Config.SESSION.get(url, timeout=Config.TIMEOUT)
+        r.raise_for_status()
+        return r.text
 
 
 class PlaywrightFetcher(IFetcher):
     def fetch(self, url: str) -> Optional[str]:
         if not PLAYWRIGHT_AVAILABLE or not Config.PLAYWRIGHT:
             return None
+        # imported lazily so the HTTP-only path works without the repo root on sys.path
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch()
-                page = browser.new_page(user_agent=Config.USER_AGENT)
+            from drivers.browser_pool import get_browser
+        except ImportError:
+            logger.exception(
+                "Playwright fallback disabled: drivers.browser_pool not importable "
+                "(run from the repo root: python -m examples.sample_run_3)"
+            )
+            return None
+        try:
+            context = get_browser(headless=True).new_context(user_agent=Config.USER_AGENT)
+            try:
+                page = context.new_page()
                 page.goto(url, timeout=Config.PLAYWRIGHT_TIMEOUT_MS)
-                content = page.content()
-                browser.close()
-                return content
+                return page.content()
+            finally:
+                context.close()
         except Exception:
             return None
 
@@ -134,25 +184,71 @@ class PdfLocator:
 
     @staticmethod
     def _extract_pdf_from_html(html: str, base_url: str) -> Optional[str]:
-        soup = BeautifulSoup(html, "html.parser")
-
-        # direct selector
-        a = soup.select_one('a[href$=".pdf"]')
-        if a:
-            return urljoin(base_url, a["href"])
-
-        # heuristic scan
-        for link in soup.find_all("a", href=True):
-            href = link["href"]
-            if ".pdf" in href.lower():
+        if SELECTOLAX_AVAILABLE:
+            hrefs = (a.attributes.get("href") or "" for a in HTMLParser(html).css("a[href]"))
+        else:
+            hrefs = (a["href"] for a in BeautifulSoup(html, "html.parser").find_all("a", href=True))
+
+        # single pass: a link ending in .pdf wins outright, otherwise fall back
+        # to the first link that merely mentions .pdf
+        best = None
+        for href in hrefs:
+            lowered = href.lower()
+            if lowered.endswith(".pdf"):
                 return urljoin(base_url, href)
+            if best is None and ".pdf" in lowered:
+                best = href
 
-        return None
+        return urljoin(base_url, best) if best else None
 
 
 # ----------------------------------------------------
 # EXTRACTION LAYER
 # ----------------------------------------------------
+class PdfMerkleHasher:
+    """Hashes the PDF in fixed-size leaves so changes can be localized."""
+    _STARTXREF_RE = re.compile(rb"startxref\s+(\d+)")
+
+    def hash(self, pdf_bytes: bytes) -> Dict:
+        size = Config.MERKLE_LEAF_SIZE
+        mv = memoryview(pdf_bytes)
+        leafs = [hashlib.sha3_256(mv[i:i + size]).digest() for i in range(0, len(mv), size)]
+
+        level = leafs or [hashlib.sha3_256(b"").digest()]
+        while len(level) > 1:
+            level = [
+                hashlib.sha3_256(b"".join(level[i:i + 2])).digest()
+                for i in range(0, len(level), 2)
+            ]
+        return {
+            "root": level[0].hex(),
+            "leafs": [leaf.hex() for leaf in leafs],
+            "trailer_start": self.trailer_start(pdf_bytes),
+        }
+
+    @classmethod
+    def trailer_start(cls, pdf_bytes: bytes) -> Optional[int]:
+        """Byte offset of the last xref section (xref table/stream + trailer), if found."""
+        idx = pdf_bytes.rfind(b"startxref")
+        if idx < 0:
+            return None
+        m = cls._STARTXREF_RE.match(pdf_bytes, idx)
+        if not m:
+            return None
+        offset = int(m.group(1))
+        return offset if 0 < offset < idx else None
+
+    @staticmethod
+    def is_trailer_only_change(old_leafs, new_leafs, trailer_start: Optional[int]) -> bool:
+        """True when a handful of leaves differ and all lie wholly after trailer_start."""
+        if trailer_start is None or not old_leafs or len(old_leafs) != len(new_leafs):
+            return False
+        changed = [i for i, (a, b) in enumerate(zip(old_leafs, new_leafs)) if a != b]
+        if not changed or len(changed) >= Config.MERKLE_MAX_CHANGED_LEAVES:
+            return False
+        return all(i * Config.MERKLE_LEAF_SIZE >= trailer_start for i in changed)
+
+
 class PdfMetadataExtractor:
     def extract(self, pdf_bytes: bytes) -> Dict:
         out = {}
@@ -168,6 +264,9 @@ class PdfMetadataExtractor:
 class PdfTextExtractor:
     def extract(self, pdf_bytes: bytes) -> str:
         try:
+            if FITZ_AVAILABLE:
+                with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+                    return "".join(page.get_text("text") for page in doc)
             with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
                 pages = []
                 for page in pdf.pages:
@@ -178,20 +277,42 @@ class PdfTextExtractor:
 
 
 class PdfFieldExtractor:
+    @staticmethod
+    def _hash_raw(raw: Dict) -> str:
+        # hashed once here so FieldDiff compares short digests instead of re-serializing.
+        # Always the same serializer: the digests are persisted in state.json.
+        data = json.dumps(raw, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        return hashlib.blake2b(data.encode("utf-8"), digest_size=8).hexdigest()
+
     def extract(self, pdf_bytes: bytes) -> Dict:
         fields = {}
         try:
-            pdf = pikepdf.open(io.BytesIO(pdf_bytes))
-            if "/AcroForm" in pdf.root:
-                for f in pdf.root.AcroForm.get("/Fields", []):
-                    obj = f.get_object()
+            with pikepdf.open(io.BytesIO(pdf_bytes)) as pdf:
+                if "/AcroForm" not in pdf.Root:
+                    return fields
+                # walk the field tree with an explicit stack; nested kids get
+                # fully-qualified "parent.child" names. pikepdf resolves indirect
+                # references on access, so array items are the field dicts themselves.
+                stack = [(f, None) for f in reversed(pdf.Root.AcroForm.get("/Fields", []))]
+                seen = set()
+                while stack:
+                    obj, parent = stack.pop()
+                    if obj.objgen != (0, 0):
+                        if obj.objgen in seen:
+                            continue
+                        seen.add(obj.objgen)
                     name = obj.get("/T")
+                    qualified = parent
                     if name:
-                        fields[str(name)] = {
-                            "raw": {k: str(v) for k, v in obj.items()}
-                        }
+                        qualified = f"{parent}.{name}" if parent else str(name)
+                        # /Kids and /Parent would drag whole subtrees into the diff
+                        raw = {k: str(v) for k, v in obj.items() if k not in ("/Kids", "/Parent")}
+                        fields[qualified] = {"raw": raw, "_hash": self._hash_raw(raw)}
+                    kids = obj.get("/Kids")
+                    if kids:
+                        stack.extend((kid, qualified) for kid in reversed(kids))
         except Exception:
-            pass
+            logger.exception("Could not extract PDF form fields")
         return fields
 
 
@@ -212,8 +333,14 @@ class FieldDiff:
         removed = list(sorted(set(old) - set(new)))
         modified = {}
         for key in set(old) & set(new):
-            if json.dumps(old[key], sort_keys=True) != json.dumps(new[key], sort_keys=True):
-                modified[key] = {"old": old[key], "new": new[key]}
+            o, n = old[key], new[key]
+            if "_hash" in o and "_hash" in n:
+                differs = o["_hash"] != n["_hash"]
+            else:
+                # state written before field hashes existed
+                differs = json.dumps(o.get("raw"), sort_keys=True) != json.dumps(n.get("raw"), sort_keys=True)
+            if differs:
+                modified[key] = {"old": o, "new": n}
         return {"added": added, "removed": removed, "modified": modified}
 
 
@@ -226,12 +353,20 @@ class StateRepository:
         os.makedirs(Config.BASE_DIR, exist_ok=True)
 
     def load(self) -> Dict:
-        if os.path.exists(self.path):
-            return json.load(open(self.path))
-        return {}
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return {}
+        return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
 
     def save(self, state: Dict):
-        json.dump(state, open(self.path, "w"), indent=2)
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(state, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(state, indent=2).encode("utf-8")
+        with open(self.path, "wb") as f:
+            f.write(data)
 
 
 class SnapshotRepository:
@@ -242,10 +377,19 @@ class SnapshotRepository:
     def save_snapshot(self, name: str, pdf_bytes: bytes, text: str, fields: Dict, metadata: Dict):
         folder = os.path.join(self.root, name)
         os.makedirs(folder, exist_ok=True)
-        open(os.path.join(folder, "pdf.bin"), "wb").write(pdf_bytes)
-        open(os.path.join(folder, "text.txt"), "w", encoding="utf-8").write(text)
-        json.dump(fields, open(os.path.join(folder, "fields.json"), "w"), indent=2)
-        json.dump(metadata, open(os.path.join(folder, "metadata.json"), "w"), indent=2)
+        if Config.SNAPSHOT_COMPRESS:
+            self._write(folder, "pdf.bin.gz", gzip.compress(pdf_bytes, compresslevel=3))
+        else:
+            self._write(folder, "pdf.bin", pdf_bytes)
+        self._write(folder, "text.txt", text.encode("utf-8"))
+        self._write(folder, "fields.json", json.dumps(fields, indent=2).encode("utf-8"))
+        self._write(folder, "metadata.json", json.dumps(metadata, indent=2).encode("utf-8"))
+
+    @staticmethod
+    def _write(folder: str, filename: str, data: bytes):
+        # serialize up front and write once instead of many small json.dump writes
+        with open(os.path.join(folder, filename), "wb") as f:
+            f.write(data)
 
 
 # ----------------------------------------------------
@@ -257,7 +401,7 @@ class Notifier:
         if not Config.WEBHOOK_URL:
             return
         try:
-            requests.post(Config.WEBHOOK_URL, json={"text": message})
+            Config.SESSION.post(Config.WEBHOOK_URL, json={"text": message}, timeout=Config.TIMEOUT)
         except Exception:
             pass
 
@@ -267,38 +411,64 @@ class Notifier:
 # ----------------------------------------------------
 class ChangeDetector:
     def __init__(self):
+        self.merkle_hasher = PdfMerkleHasher()
         self.metadata_extractor = PdfMetadataExtractor()
         self.text_extractor = PdfTextExtractor()
         self.field_extractor = PdfFieldExtractor()
 
-    def detect(self, prev_state: Dict, pdf_bytes: bytes) -> Tuple[bool, Dict]:
-        new_hash = hashlib.sha256(pdf_bytes).hexdigest()
-        metadata = self.metadata_extractor.extract(pdf_bytes)
-        text = self.text_extractor.extract(pdf_bytes)
-        fields = self.field_extractor.extract(pdf_bytes)
-
-        changed = False
+    def detect(self, prev_state: Dict, pdf_bytes: bytes, new_hash: Optional[str] = None) -> Tuple[bool, Dict]:
+        # the orchestrator hashes while streaming the download; only hash here if it didn't
+        if new_hash is None:
+            new_hash = hashlib.sha256(pdf_bytes).hexdigest()
+
+        # identical bytes -> nothing to parse; skip pikepdf/pdfplumber entirely
+        if prev_state.get("hash") == new_hash:
+            return False, {"hash": new_hash}
+
+        # only a few trailer leaves moved (ModDate, xref offsets): the content is
+        # untouched, so carry the previous text/fields over instead of re-parsing
+        merkle = self.merkle_hasher.hash(pdf_bytes)
+        if PdfMerkleHasher.is_trailer_only_change(
+            prev_state.get("leafs"), merkle["leafs"], merkle["trailer_start"]
+        ):
+            return True, {
+                "hash": new_hash,
+                "merkle_root": merkle["root"],
+                "leafs": merkle["leafs"],
+                "metadata": self.metadata_extractor.extract(pdf_bytes),
+                "text": prev_state.get("text", ""),
+                "fields": prev_state.get("fields", {}),
+                "reasons": ["metadata-only"],
+                "diff": {},
+            }
+
+        # the extractors only read the same immutable bytes, so run them side by side
+        with ThreadPoolExecutor(max_workers=3) as ex:
+            f_meta = ex.submit(self.metadata_extractor.extract, pdf_bytes)
+            f_text = ex.submit(self.text_extractor.extract, pdf_bytes)
+            f_fields = ex.submit(self.field_extractor.extract, pdf_bytes)
+            metadata, text, fields = f_meta.result(), f_text.result(), f_fields.result()
+
+        changed = True
         reasons = []
 
         # metadata first
         if prev_state.get("metadata", {}).get("/ModDate") != metadata.get("/ModDate"):
-            changed = True
             reasons.append("ModDate change")
 
         # hash fallback
-        if prev_state.get("hash") != new_hash:
-            changed = True
-            reasons.append("hash change")
+        reasons.append("hash change")
 
         diff_data = {}
-        if changed:
-            old_text = prev_state.get("text", "")
-            diff_data["text_diff"] = TextDiff.diff(old_text, text)
-            old_fields = prev_state.get("fields", {})
-            diff_data["field_diff"] = FieldDiff.diff(old_fields, fields)
+        old_text = prev_state.get("text", "")
+        diff_data["text_diff"] = TextDiff.diff(old_text, text)
+        old_fields = prev_state.get("fields", {})
+        diff_data["field_diff"] = FieldDiff.diff(old_fields, fields)
 
         return changed, {
             "hash": new_hash,
+            "merkle_root": merkle["root"],
+            "leafs": merkle["leafs"],
             "metadata": metadata,
             "text": text,
             "fields": fields,
@@ -322,13 +492,22 @@ class MonitorOrchestrator:
             self.notifier.notify("PDF not found")
             return
 
-        pdf_bytes = requests.get(pdf_url, headers={"User-Agent": Config.USER_AGENT}).content
         prev_state = self.state_repo.load()
+        download = self._download(pdf_url, prev_state)
+        if download is None:
+            print("No change detected (304 Not Modified)")
+            return
+        pdf_bytes, pdf_hash, validators = download
 
-        changed, data = self.detector.detect(prev_state, pdf_bytes)
+        changed, data = self.detector.detect(prev_state, pdf_bytes, pdf_hash)
         if not changed:
+            # same bytes, but keep the validators fresh so the next poll can get a 304
+            if any(prev_state.get(k) != v for k, v in validators.items()):
+                prev_state.update(validators)
+                self.state_repo.save(prev_state)
             print("No change detected")
             return
+        data.update(validators)
 
         # Save snapshot
         name = datetime.datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
@@ -341,7 +520,42 @@ class MonitorOrchestrator:
         summary = "I-765 Updated: " + ", ".join(data["reasons"])
         self.notifier.notify(summary)
 
+    @staticmethod
+    def _download(pdf_url: str, prev_state: Dict) -> Optional[Tuple[bytes, str, Dict]]:
+        """Conditionally fetch the PDF, hashing each chunk as it arrives.
+
+        Returns None when the server answers 304 Not Modified.
+        """
+        # validators only apply to the URL they were issued for; a new edition
+        # under a new filename must be fetched unconditionally
+        headers = {}
+        if prev_state.get("pdf_url") == pdf_url:
+            if prev_state.get("etag"):
+                headers["If-None-Match"] = prev_state["etag"]
+            if prev_state.get("last_modified"):
+                headers["If-Modified-Since"] = prev_state["last_modified"]
+
+        h = hashlib.sha256()
+        buf = bytearray()
+        with Config.SESSION.get(pdf_url, headers=headers, stream=True, timeout=Config.TIMEOUT) as r:
+            if r.status_code == 304:
+                return None
+            r.raise_for_status()
+            for chunk in r.iter_content(Config.CHUNK_SIZE):
+                h.update(chunk)
+                buf.extend(chunk)
+            validators = {
+                "pdf_url": pdf_url,
+                "etag": r.headers.get("ETag"),
+                "last_modified": r.headers.get("Last-Modified"),
+            }
+        # bytes, not the bytearray: io.BytesIO shares a bytes buffer but copies a bytearray
+        return bytes(buf), h.hexdigest(), validators
+
 
 # ----------------------------------------------------
 if __name__ == "__main__":
-    MonitorOrchestrator().run()
+    try:
+        MonitorOrchestrator().run()
+    finally:
+        Config.SESSION.close()
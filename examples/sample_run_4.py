@@ -1,16 +1,25 @@
-from urllib.parse import urljoin
 from playwright.sync_api import sync_playwright
 import requests
 import json
 import re
 
+# orjson takes the raw bytes and is several times faster than json.loads
+try:
+    import orjson
+    _loads = orjson.loads
+except Exception:
+    _loads = json.loads
+
+_MD_LINK_RE = re.compile(r'\((https?://[^\s]+)\)')
+_URL_RE = re.compile(r'(https?://[^\s]+)')
+
 def clean_ollama_response(text):
     # Try to extract URL inside markdown link [text](url)
-    match = re.search(r'\((https?://[^\s]+)\)', text)
+    match = _MD_LINK_RE.search(text)
     if match:
         return match.group(1)
     # Otherwise, extract any URL in the text
-    match = re.search(r'(https?://[^\s]+)', text)
+    match = _URL_RE.search(text)
     if match:
         return match.group(1)
     # Fallback, return original cleaned string
@@ -33,19 +42,19 @@ def ask_ollama(links):
         stream=True,
     )
 
-    full_text = ""
+    parts = []
 
     for line in response.iter_lines():
         if not line:
             continue
         try:
-            data = json.loads(line.decode("utf-8"))
-        except json.JSONDecodeError:
+            data = _loads(line)
+        except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses this
             continue
         if "response" in data:
-            full_text += data["response"]
+            parts.append(data["response"])
 
-    return full_text.strip()
+    return "".join(parts).strip()
 
 with sync_playwright() as p:
     browser = p.chromium.launch(headless=False)
@@ -54,11 +63,11 @@ with sync_playwright() as p:
 
     page.goto(URL)
 
-    anchors = page.query_selector_all('a[href*=".pdf"]')
-    if not anchors:
+    # one CDP roundtrip for every href; e.href is already absolute
+    pdf_links = page.eval_on_selector_all('a[href*=".pdf"]', "els => els.map(e => e.href)")
+    if not pdf_links:
         raise RuntimeError("No PDF links found on the page")
 
-    pdf_links = [urljoin(URL, a.get_attribute("href")) for a in anchors if a.get_attribute("href")]
     print("\nPDF LINKS FOUND:")
     for link in pdf_links:
         print(" -", link)
@@ -67,18 +76,14 @@ with sync_playwright() as p:
     chosen_link = clean_ollama_response(chosen_link_raw)
     print("\nOllama chose:", chosen_link)
 
-    target_anchor = None
-    for a in anchors:
-        href = urljoin(URL, a.get_attribute("href"))
-        if href == chosen_link:
-            target_anchor = a
-            break
-
-    if not target_anchor:
+    if chosen_link not in pdf_links:
         raise RuntimeError("Ollama returned a link that was not found on the page")
 
+    # the href attribute may be relative, so address the anchor by position
+    target_anchor = page.locator('a[href*=".pdf"]').nth(pdf_links.index(chosen_link))
+
     # Add download attribute to force download
-    page.eval_on_selector(f'a[href="{chosen_link}"]', "el => el.setAttribute('download', '')")
+    target_anchor.evaluate("el => el.setAttribute('download', '')")
 
     with page.expect_download() as dl:
         target_anchor.click()
@@ -1,12 +1,13 @@
 class ActionHandler:
     registry = []
+    ACTION = None
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
         ActionHandler.registry.append(cls)
 
     def can_handle(self, action):
-        raise NotImplementedError
+        return action.get("action") == self.ACTION
 
     def handle(self, action, driver):
         raise NotImplementedError
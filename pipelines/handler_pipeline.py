@@ -3,13 +3,12 @@ from . import handlers
 
 class HandlerPipeline:
     def __init__(self):
-        self.handlers = [cls() for cls in ActionHandler.registry]
+        self.handlers = {cls.ACTION: cls() for cls in ActionHandler.registry}
 
     def execute(self, actions, driver):
+        get_handler = self.handlers.get
         for action in actions:
-            for handler in self.handlers:
-                if handler.can_handle(action):
-                    handler.handle(action, driver)
-                    break
-            else:
+            handler = get_handler(action.get("action"))
+            if handler is None:
                 raise ValueError(f"No handler found for action: {action}")
+            handler.handle(action, driver)
@@ -1,8 +1,7 @@
 from pipelines.base_handler import ActionHandler
 
 class ClickHandler(ActionHandler):
-    def can_handle(self, action):
-        return action.get("action") == "click"
+    ACTION = "click"
 
     def handle(self, action, driver):
         driver.click(action["selector"])
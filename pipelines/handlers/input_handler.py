@@ -1,8 +1,7 @@
 from pipelines.base_handler import ActionHandler
 
 class InputHandler(ActionHandler):
-    def can_handle(self, action):
-        return action.get("action") == "input"
+    ACTION = "input"
 
     def handle(self, action, driver):
         driver.input(action["selector"], action["value"])
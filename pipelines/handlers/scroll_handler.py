@@ -1,8 +1,7 @@
 from pipelines.base_handler import ActionHandler
 
 class ScrollHandler(ActionHandler):
-    def can_handle(self, action):
-        return action.get("action") == "scroll"
+    ACTION = "scroll"
 
     async def handle(self, action, driver):
         page = driver.page
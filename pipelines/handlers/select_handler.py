@@ -1,8 +1,7 @@
 from pipelines.base_handler import ActionHandler
 
 class SelectHandler(ActionHandler):
-    def can_handle(self, action):
-        return action.get("action") == "select"
+    ACTION = "select"
 
     async def handle(self, action, driver):
         page = driver.page
@@ -1,8 +1,7 @@
 from pipelines.base_handler import ActionHandler
 
 class WaitForSelectorHandler(ActionHandler):
-    def can_handle(self, action):
-        return action.get("action") == "wait_for"
+    ACTION = "wait_for"
 
     async def handle(self, action, driver):
         page = driver.page
@@ -0,0 +1,115 @@
+import difflib
+import io
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("requests")
+pikepdf = pytest.importorskip("pikepdf")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "examples")]
+
+import sample_run_3  # noqa: E402
+from sample_run_3 import FieldDiff, PdfFieldExtractor, PdfMerkleHasher, TextDiff  # noqa: E402
+
+
+def _unified(old_lines, new_lines):
+    return "".join(difflib.unified_diff(old_lines, new_lines, lineterm=""))
+
+
+def test_text_diff_repeated_lines_match_difflib():
+    old = "b e e d c c b e b c b b c a c a".split()
+    new = "b e d y c b e b c b c a c a".split()
+    assert TextDiff.diff("\n".join(old), "\n".join(new)) == _unified(old, new)
+
+
+def test_text_diff_no_change():
+    assert TextDiff.diff("a\nb\nc", "a\nb\nc") == ""
+
+
+def _form_pdf(child_value):
+    pdf = pikepdf.new()
+    pdf.add_blank_page()
+    child = pdf.make_indirect(pikepdf.Dictionary(
+        T=pikepdf.String("c"), V=pikepdf.String(child_value), FT=pikepdf.Name.Tx,
+    ))
+    parent = pdf.make_indirect(pikepdf.Dictionary(T=pikepdf.String("p"), Kids=pikepdf.Array([child])))
+    child.Parent = parent
+    top = pdf.make_indirect(pikepdf.Dictionary(
+        T=pikepdf.String("top"), V=pikepdf.String("x"), FT=pikepdf.Name.Tx,
+    ))
+    pdf.Root.AcroForm = pikepdf.Dictionary(Fields=pikepdf.Array([parent, top]))
+    buf = io.BytesIO()
+    pdf.save(buf)
+    return buf.getvalue()
+
+
+def test_field_extractor_walks_nested_kids():
+    fields = PdfFieldExtractor().extract(_form_pdf("1"))
+    assert set(fields) == {"p", "p.c", "top"}
+    assert "/Kids" not in fields["p"]["raw"]
+    assert "/Parent" not in fields["p.c"]["raw"]
+
+
+def test_field_diff_reports_changed_value():
+    extractor = PdfFieldExtractor()
+    old, new = extractor.extract(_form_pdf("1")), extractor.extract(_form_pdf("2"))
+    assert old["p.c"]["_hash"] != new["p.c"]["_hash"]
+    assert FieldDiff.diff(old, new) == {
+        "added": [],
+        "removed": [],
+        "modified": {"p.c": {"old": old["p.c"], "new": new["p.c"]}},
+    }
+
+
+def test_field_hash_independent_of_orjson(monkeypatch):
+    raw = {"/T": "a", "/V": "\u00e9"}
+    digest = PdfFieldExtractor._hash_raw(raw)
+    monkeypatch.setattr(sample_run_3, "ORJSON_AVAILABLE", not sample_run_3.ORJSON_AVAILABLE)
+    assert PdfFieldExtractor._hash_raw(raw) == digest
+
+
+def _pdf_like(body_size, mod_date=b"D:20240101"):
+    body = b"%PDF-1.4\n" + b"x" * (body_size - 9)
+    tail = (
+        b"xref\n0 1\n0000000000 65535 f \ntrailer\n<< /ModDate (" + mod_date + b") >>\n"
+        b"startxref\n" + str(len(body)).encode() + b"\n%%EOF\n"
+    )
+    return body + tail
+
+
+def _trailer_only(old, new):
+    hasher = PdfMerkleHasher()
+    new_merkle = hasher.hash(new)
+    return PdfMerkleHasher.is_trailer_only_change(
+        hasher.hash(old)["leafs"], new_merkle["leafs"], new_merkle["trailer_start"]
+    )
+
+
+def test_merkle_change_inside_trailer():
+    # body is leaf-aligned so the trailer starts on its own leaf
+    old = _pdf_like(4096)
+    assert PdfMerkleHasher.trailer_start(old) == 4096
+    assert _trailer_only(old, _pdf_like(4096, mod_date=b"D:20240202"))
+
+
+def test_merkle_change_outside_trailer():
+    old = _pdf_like(4096)
+    new = bytearray(old)
+    new[10] = ord("y")
+    assert not _trailer_only(old, bytes(new))
+
+
+def test_merkle_small_file_is_not_all_trailer():
+    old = _pdf_like(3000)
+    new = bytearray(old)
+    new[10] = ord("y")
+    assert not _trailer_only(old, bytes(new))
+
+
+def test_merkle_without_startxref():
+    old = b"x" * 3000
+    assert PdfMerkleHasher.trailer_start(old) is None
+    assert not _trailer_only(old, b"y" + old[1:])